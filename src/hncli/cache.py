@@ -1,72 +1,283 @@
 """
 Simple caching module for the Hacker News CLI.
+
+Entries are persisted in a single SQLite database in the cache directory and
+mirrored in memory for the lifetime of the process. Writes go through a
+background thread so callers never wait on the disk.
 """
 
+import atexit
+import itertools
+import operator
 import os
-import json
+import queue
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from hncli import serialization
+
+# Cache keys are tuples of (prefix, *args); they hash cheaply for the
+# in-memory lookups and are only formatted as strings for the database.
+CacheKey = Tuple[Any, ...]
+
+# A cached value with the time it was stored and the HTTP ETag it came with
+Entry = Tuple[float, Any, Optional[str]]
+
+# In-memory cache structure: {key: (timestamp, value, etag)}
+_cache: Dict[CacheKey, Entry] = {}
+
+# Lazily opened database connection, shared by all threads under _db_lock
+_connection: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()
 
-# Cache structure: {key: (timestamp, value)}
-_cache = {}
+# Pending database writes as (operation, params), drained by a daemon thread
+# that commits everything queued so far in one transaction
+_write_queue: "queue.Queue[Tuple[str, Tuple[Any, ...]]]" = queue.Queue()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+_WRITE_STATEMENTS = {
+    "set": "INSERT OR REPLACE INTO cache (key, ts, value, etag) VALUES (?, ?, ?, ?)",
+    "touch": "UPDATE cache SET ts = ? WHERE key = ?",
+    "dead": "INSERT OR IGNORE INTO dead_items (id) VALUES (?)",
+}
+
+# IDs of items known to be deleted, loaded from the database on first use
+_dead_ids: Optional[Set[int]] = None
+
+# Bump when the tables change; older databases are dropped and rebuilt
+_SCHEMA_VERSION = 1
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL NOT NULL, value BLOB NOT NULL, etag TEXT)",
+    "CREATE TABLE IF NOT EXISTS dead_items (id INTEGER PRIMARY KEY)",
+)
+
+# Resolved (and created) on first use
+_cache_dir: Optional[Path] = None
 
 def get_cache_dir() -> Path:
-    """Get the path to the cache directory."""
-    cache_dir = Path.home() / ".cache" / "hncli"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
+    """Get the path to the cache directory, creating it on first call."""
+    global _cache_dir
+    if _cache_dir is None:
+        cache_dir = Path.home() / ".cache" / "hncli"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _cache_dir = cache_dir
+    return _cache_dir
+
+def get_db_path() -> Path:
+    """Get the path to the cache database."""
+    return get_cache_dir() / "cache.db"
 
-def cache_key(prefix: str, *args) -> str:
+def cache_key(prefix: str, *args) -> CacheKey:
     """Create a cache key from a prefix and arguments."""
-    return f"{prefix}_{'-'.join(str(arg) for arg in args)}"
+    return (prefix, *args)
 
-def get_cache_file(key: str) -> Path:
-    """Get the path to a cache file for a key."""
-    return get_cache_dir() / f"{key}.json"
+def _db_key(key: CacheKey) -> str:
+    """Format a cache key as the string stored in the database."""
+    return f"{key[0]}_{'-'.join(map(str, key[1:]))}"
 
-def load_cache_from_disk() -> None:
-    """Load all cache files from disk."""
-    cache_dir = get_cache_dir()
-    for cache_file in cache_dir.glob("*.json"):
-        try:
-            with open(cache_file, "r") as f:
-                key = cache_file.stem
-                timestamp, value = json.load(f)
-                _cache[key] = (timestamp, value)
-        except Exception:
-            # Ignore corrupted cache files
-            pass
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database on first use. Must be called with _db_lock held."""
+    global _connection
+    if _connection is None:
+        connection = sqlite3.connect(str(get_db_path()), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS cache")
+            connection.execute("DROP TABLE IF EXISTS dead_items")
+            connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+        _connection = connection
+    return _connection
+
+def _encode_set(params: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    key, timestamp, value, etag = params
+    return (key, timestamp, serialization.dumps(value), etag)
+
+def _write_batch(batch: List[Tuple[str, Tuple[Any, ...]]]) -> None:
+    """Apply queued writes to the database in a single transaction.
 
-def save_cache_to_disk(key: str) -> None:
-    """Save a cache entry to disk."""
-    if key in _cache:
-        cache_file = get_cache_file(key)
+    Consecutive writes of the same kind are handed to ``executemany`` so the
+    statement is prepared once per run rather than once per entry; runs keep
+    their queue order.
+    """
+    try:
+        with _db_lock:
+            connection = _get_connection()
+            with connection:
+                for operation, run in itertools.groupby(batch, key=operator.itemgetter(0)):
+                    params = (row for _, row in run)
+                    rows = map(_encode_set, params) if operation == "set" else params
+                    connection.executemany(_WRITE_STATEMENTS[operation], rows)
+    except Exception:
+        # Ignore errors when saving cache; the writer thread must keep running
+        pass
+
+def _run_writer() -> None:
+    """Drain the write queue forever, batching whatever has piled up."""
+    while True:
+        batch = [_write_queue.get()]
+        while True:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
         try:
-            with open(cache_file, "w") as f:
-                json.dump(_cache[key], f)
-        except Exception:
-            # Ignore errors when saving cache
-            pass
+            _write_batch(batch)
+        finally:
+            for _ in batch:
+                _write_queue.task_done()
+
+def _enqueue_write(operation: str, params: Tuple[Any, ...]) -> None:
+    """Queue a database write, starting the writer thread on first use."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_run_writer, name="hncli-cache-writer", daemon=True)
+                _writer.start()
+                atexit.register(flush)
+    _write_queue.put((operation, params))
+
+def flush() -> None:
+    """Block until every queued cache write has been committed."""
+    if _writer is not None:
+        _write_queue.join()
 
-def get(key: str, ttl: int = 300) -> Optional[Any]:
+def close() -> None:
+    """Close the cache database; it is reopened on next use."""
+    global _connection
+    flush()
+    with _db_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+# Stay well below SQLite's limit on the number of bound parameters
+_MAX_LOAD_KEYS = 500
+
+def _load_entries(keys: List[CacheKey]) -> None:
+    """Load cache entries from the database into memory, where they exist."""
+    by_db_key = {_db_key(key): key for key in keys}
+    db_keys = list(by_db_key)
+    try:
+        for start in range(0, len(db_keys), _MAX_LOAD_KEYS):
+            chunk = db_keys[start:start + _MAX_LOAD_KEYS]
+            placeholders = ", ".join("?" * len(chunk))
+            with _db_lock:
+                rows = _get_connection().execute(
+                    f"SELECT key, ts, value, etag FROM cache WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+            for db_key, timestamp, value, etag in rows:
+                try:
+                    _cache[by_db_key[db_key]] = (timestamp, serialization.loads(value), etag)
+                except ValueError:
+                    # Ignore corrupted cache entries
+                    pass
+    except sqlite3.Error:
+        # Ignore an unreadable cache database
+        pass
+
+def get_entry(key: CacheKey) -> Optional[Entry]:
+    """Get the raw ``(timestamp, value, etag)`` entry for a key, even if expired."""
+    if key not in _cache:
+        # Entries are read from the database on demand
+        _load_entries([key])
+    return _cache.get(key)
+
+def get(key: CacheKey, ttl: int = 300) -> Optional[Any]:
     """Get a value from cache if it exists and is not expired."""
-    if key in _cache:
-        timestamp, value = _cache[key]
+    entry = get_entry(key)
+    if entry is not None:
+        timestamp, value, _ = entry
         if time.time() - timestamp < ttl:
             return value
     return None
 
-def set(key: str, value: Any) -> None:
-    """Set a value in the cache."""
-    _cache[key] = (time.time(), value)
-    save_cache_to_disk(key)
+def get_many(keys: List[CacheKey], ttl: int = 300) -> Dict[CacheKey, Any]:
+    """Get the fresh values among ``keys``, reading the database only once.
+
+    Keys that are missing or expired are left out of the result.
+    """
+    missing = [key for key in keys if key not in _cache]
+    if missing:
+        _load_entries(missing)
+    now = time.time()
+    values = {}
+    for key in keys:
+        entry = _cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            values[key] = entry[1]
+    return values
+
+def set(key: CacheKey, value: Any, etag: Optional[str] = None) -> None:
+    """Set a value in the cache, along with the ETag it was served with."""
+    entry = (time.time(), value, etag)
+    _cache[key] = entry
+    _enqueue_write("set", (_db_key(key), entry[0], value, etag))
+
+def touch(key: CacheKey) -> None:
+    """Mark an existing entry as fresh again without rewriting its value."""
+    entry = _cache.get(key)
+    if entry is None:
+        return
+    timestamp = time.time()
+    _cache[key] = (timestamp, entry[1], entry[2])
+    _enqueue_write("touch", (timestamp, _db_key(key)))
+
+def _load_dead_ids() -> Set[int]:
+    """Get the set of dead item IDs, loading it from the database on first use.
+
+    Callers work on the returned set rather than re-reading the global, which
+    ``clear`` may reset from another thread at any time.
+    """
+    global _dead_ids
+    dead_ids = _dead_ids
+    if dead_ids is None:
+        try:
+            with _db_lock:
+                rows = _get_connection().execute("SELECT id FROM dead_items").fetchall()
+        except sqlite3.Error:
+            rows = []
+        # Note: ``set`` is shadowed by this module's cache setter
+        dead_ids = {row[0] for row in rows}
+        _dead_ids = dead_ids
+    return dead_ids
+
+def is_dead(item_id: int) -> bool:
+    """Check whether an item is known to be deleted."""
+    return item_id in _load_dead_ids()
+
+def mark_dead(item_id: int) -> None:
+    """Remember that an item is deleted so it is never fetched again."""
+    dead_ids = _load_dead_ids()
+    if item_id in dead_ids:
+        return
+    dead_ids.add(item_id)
+    _enqueue_write("dead", (item_id,))
 
 def clear() -> None:
     """Clear the entire cache."""
+    global _dead_ids
+    # Let queued writes land first so they cannot resurrect cleared entries
+    flush()
     _cache.clear()
-    cache_dir = get_cache_dir()
-    for cache_file in cache_dir.glob("*.json"):
+    _dead_ids = None
+    try:
+        with _db_lock:
+            connection = _get_connection()
+            with connection:
+                connection.execute("DELETE FROM cache")
+                connection.execute("DELETE FROM dead_items")
+    except sqlite3.Error:
+        pass
+    # Remove per-entry files left behind by the old JSON file cache
+    for cache_file in get_cache_dir().glob("*.json"):
         try:
             os.unlink(cache_file)
         except Exception:
@@ -76,16 +287,15 @@ def clear() -> None:
 def clear_expired(ttl: int = 300) -> None:
     """Clear expired cache entries."""
     now = time.time()
-    expired_keys = [key for key, (timestamp, _) in _cache.items() if now - timestamp >= ttl]
-    
+    expired_keys = [key for key, (timestamp, _, _) in _cache.items() if now - timestamp >= ttl]
+
     for key in expired_keys:
         del _cache[key]
-        cache_file = get_cache_file(key)
-        try:
-            os.unlink(cache_file)
-        except Exception:
-            # Ignore errors when deleting cache files
-            pass
-
-# Initialize cache from disk
-load_cache_from_disk() 
\ No newline at end of file
+    flush()
+    try:
+        with _db_lock:
+            connection = _get_connection()
+            with connection:
+                connection.execute("DELETE FROM cache WHERE ts <= ?", (now - ttl,))
+    except sqlite3.Error:
+        pass
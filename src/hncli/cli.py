@@ -5,22 +5,30 @@ HackerNews CLI - A command-line interface for browsing Hacker News
 
 
 import typer
+from typer import confirm as _confirm
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.prompt import Prompt
 from rich.markup import escape
 import webbrowser
-from typing import Any, List, Optional, Tuple
+import html
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 import textwrap
-from hncli import config, cache
+from hncli import config, cache, serialization
 from hncli.errors import APIRequestError
 from hncli.models import Story, User
-import os
+import functools
+import itertools
 import shutil
+import signal
 import re
-import inspect
+import sys
+import time
 import click
 
 # ---------------------------------------------------------------------------
@@ -30,9 +38,12 @@ import click
 # ``Parameter.make_metavar``. When Click 8.2+ is used, calling ``make_metavar``
 # without a context raises ``TypeError`` during command execution.  To maintain
 # compatibility with newer Click versions, we patch ``Parameter.make_metavar``
-# to accept an optional ``ctx`` argument.
+# to accept an optional ``ctx`` argument. The check reads the code object's
+# argument names directly, which is much cheaper at startup than
+# ``inspect.signature`` and, unlike ``click.__version__``, is not deprecated.
 
-if "ctx" in inspect.signature(click.Parameter.make_metavar).parameters:
+_make_metavar_code = click.Parameter.make_metavar.__code__
+if "ctx" in _make_metavar_code.co_varnames[:_make_metavar_code.co_argcount]:
     _original_make_metavar = click.Parameter.make_metavar
 
     def _patched_make_metavar(self, ctx: Optional[click.Context] = None) -> str:
@@ -43,107 +54,311 @@ if "ctx" in inspect.signature(click.Parameter.make_metavar).parameters:
     click.Parameter.make_metavar = _patched_make_metavar  # type: ignore[assignment]
 
 app = typer.Typer(help="Hacker News CLI")
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Get the shared console, created on first use.
+
+    Building it lazily keeps construction off the import path and lets tests
+    get a fresh console with ``get_console.cache_clear()``.
+    """
+    return Console()
 
 # Base URLs for the Hacker News API
 BASE_URL = "https://hacker-news.firebaseio.com/v0"
 ITEM_URL = f"{BASE_URL}/item"
 USER_URL = f"{BASE_URL}/user"
 HN_WEB_URL = "https://news.ycombinator.com"
+# Prefixes for discussion and profile pages; append the item ID or username
+HN_ITEM_URL = f"{HN_WEB_URL}/item?id="
+HN_USER_URL = f"{HN_WEB_URL}/user?id="
+
+# Shared pool for concurrent API requests. Item fetches are I/O bound, so
+# issuing them in parallel brings page load time close to max(latency)
+# instead of sum(latency).
+MAX_FETCH_WORKERS = 16
+_executor = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS)
+
+# A single pooled session keeps connections to the API alive between
+# requests, so only the first fetch pays for the TCP/TLS handshake. All API
+# traffic goes to one host, so few host pools are needed, but each pool holds
+# enough connections to cover every worker in the executor above. Transient
+# server errors are retried with backoff, so a Firebase hiccup does not fail
+# one item in the middle of a page that has otherwise loaded.
+REQUEST_TIMEOUT = 10
+RETRY_STATUSES = (500, 502, 503, 504)
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "hncli"
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=["GET"],
+        ),
+    ),
+)
 
 # Load configuration
 
-def get_config_value(key: str, default: Any = None) -> Any:
-    """Get a configuration value with fallback to default."""
+def get_settings() -> config.ConfigBits:
+    """Get all settings as attributes, falling back to the defaults on error."""
     try:
-        return config.get_setting(key)
+        return config.load_settings()
     except Exception:
-        return default
-
-def get_story_ids(story_type: str) -> List[int]:
-    """Get story IDs based on the story type (top, new, best)."""
-    # Check cache first
-    cache_key = cache.cache_key("stories", story_type)
-    cached = cache.get(cache_key, ttl=get_config_value("cache_timeout_minutes", 5) * 60)
-    if cached:
-        return cached
-    
-    # Fetch from API if not cached
+        return config.ConfigBits(**config.DEFAULT_CONFIG)
+
+@functools.lru_cache(maxsize=1)
+def get_cache_ttl() -> int:
+    """Get the cache timeout in seconds, resolved once per process."""
+    return get_settings().cache_timeout_minutes * 60
+
+def _fetch_json(url: str, key: cache.CacheKey, error_message: str) -> Any:
+    """Fetch a JSON document from the API, going through the cache.
+
+    Fresh cache entries are returned without a request. Expired entries that
+    carry an ETag are revalidated with ``If-None-Match``; a ``304 Not
+    Modified`` answer just renews the entry instead of downloading and
+    parsing the payload again.
+    """
+    entry = cache.get_entry(key)
+    if entry is not None and time.time() - entry[0] < get_cache_ttl():
+        return entry[1]
+
+    # Firebase only sends an ETag header when asked for one
+    headers = {"X-Firebase-ETag": "true"}
+    if entry is not None and entry[2]:
+        headers["If-None-Match"] = entry[2]
     try:
-        response = requests.get(f"{BASE_URL}/{story_type}stories.json")
+        response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and entry is not None:
+            cache.touch(key)
+            return entry[1]
         response.raise_for_status()
-        result = response.json()
-    except requests.RequestException as exc:
-        raise APIRequestError(f"Failed to fetch {story_type} stories") from exc
-    
+        # Parse the raw bytes directly (with orjson when available)
+        result = serialization.loads(response.content)
+    except (requests.RequestException, ValueError) as exc:
+        raise APIRequestError(error_message) from exc
+
     # Cache the result
-    cache.set(cache_key, result)
+    cache.set(key, result, etag=response.headers.get("ETag"))
     return result
 
+def get_story_ids(story_type: str) -> Tuple[int, ...]:
+    """Get story IDs based on the story type (top, new, best).
+
+    The IDs come back as an immutable tuple, so pages can be sliced from it
+    without any risk of a caller mutating the cached listing.
+    """
+    story_ids = _fetch_json(
+        f"{BASE_URL}/{story_type}stories.json",
+        cache.cache_key("stories", story_type),
+        f"Failed to fetch {story_type} stories",
+    )
+    return tuple(story_ids or ())
+
+# Item fields whose values repeat heavily across a thread (authors, types)
+_INTERNED_FIELDS = ("by", "type")
+
+def _intern_strings(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern repeated string fields so identical values share one object."""
+    for field in _INTERNED_FIELDS:
+        value = item.get(field)
+        if isinstance(value, str):
+            item[field] = sys.intern(value)
+    return item
+
 def get_item(item_id: int) -> Story:
-    """Get an item (story, comment, etc.) by its ID."""
-    # Check cache first
-    cache_key = cache.cache_key("item", item_id)
-    cached = cache.get(cache_key, ttl=get_config_value("cache_timeout_minutes", 5) * 60)
-    if cached:
-        return Story.model_validate(cached)
-    
-    # Fetch from API if not cached
-    try:
-        response = requests.get(f"{ITEM_URL}/{item_id}.json")
-        response.raise_for_status()
-        result = response.json()
-    except requests.RequestException as exc:
-        raise APIRequestError(f"Failed to fetch item {item_id}") from exc
-    
+    """Get an item (story, comment, etc.) by its ID.
 
+    Items that turned out to be deleted are remembered and returned as a
+    ``deleted`` placeholder without another request.
+    """
+    if cache.is_dead(item_id):
+        return Story(id=item_id, deleted=True)
 
-    # Cache the result
-    cache.set(cache_key, result)
-    return Story.model_validate(result)
-
-def get_user(username: str) -> User:
-    """Get a user profile by username."""
-    # Check cache first
-    cache_key = cache.cache_key("user", username)
-    cached = cache.get(cache_key, ttl=get_config_value("cache_timeout_minutes", 5) * 60)
-    if cached:
-        return User.model_validate(cached)
-    
-    # Fetch from API if not cached
+    result = _fetch_json(
+        f"{ITEM_URL}/{item_id}.json",
+        cache.cache_key("item", item_id),
+        f"Failed to fetch item {item_id}",
+    )
+    return _item_from_result(item_id, result)
 
-    try:
-        response = requests.get(f"{USER_URL}/{username}.json")
-        response.raise_for_status()
-        result = response.json()
-    except requests.RequestException as exc:
-        raise APIRequestError(f"Failed to fetch user {username}") from exc
-    
-    # Cache the result
-    cache.set(cache_key, result)
-    return User.model_validate(result)
+def _item_from_result(item_id: int, result: Optional[Dict[str, Any]]) -> Story:
+    """Build a Story from an item payload, remembering deleted items.
 
-def format_time_ago(timestamp: int) -> str:
-    """Format a Unix timestamp as a human-readable time ago string."""
-    from datetime import datetime
-    seconds_ago = int(datetime.now().timestamp() - timestamp)
-    
-    if seconds_ago < 60:
-        return f"{seconds_ago} seconds ago"
-    minutes_ago = seconds_ago // 60
-    if minutes_ago < 60:
-        return f"{minutes_ago} minutes ago"
-    hours_ago = minutes_ago // 60
-    if hours_ago < 24:
-        return f"{hours_ago} hours ago"
-    days_ago = hours_ago // 24
-    if days_ago < 30:
-        return f"{days_ago} days ago"
-    months_ago = days_ago // 30
-    if months_ago < 12:
-        return f"{months_ago} months ago"
-    years_ago = months_ago // 12
-    return f"{years_ago} years ago"
+    Only deletion is permanent: a missing (``null``) item may just not exist
+    yet and a dead one can be vouched back, so both are left to expire from
+    the item cache like any other payload.
+    """
+    if result is None:
+        return Story(id=item_id, deleted=True)
+    if result.get("deleted"):
+        cache.mark_dead(item_id)
+        return Story(id=item_id, deleted=True)
+    # Interning in place also covers entries just decoded from the database
+    return Story.from_api(_intern_strings(result))
+
+# Item fetches started ahead of need (e.g. the next page while the user reads
+# the current one), keyed by item ID with the time they were started. Only
+# touched from the main thread.
+_prefetched: Dict[int, Tuple[float, "Future[Story]"]] = {}
+
+def prefetch_items(item_ids: Sequence[int]) -> None:
+    """Start fetching items in the background so a later load finds them ready.
+
+    Prefetches that were never used and have outlived the cache TTL are
+    dropped first, so the table cannot grow without bound.
+    """
+    now = time.time()
+    ttl = get_cache_ttl()
+    for item_id in [item_id for item_id, (started, _) in _prefetched.items() if now - started >= ttl]:
+        del _prefetched[item_id]
+    for item_id in item_ids:
+        if item_id not in _prefetched:
+            _prefetched[item_id] = (now, _executor.submit(get_item, item_id))
+
+def _take_prefetched(item_id: int) -> Optional["Future[Story]"]:
+    """Claim the prefetch for an item, unless there is none or it has expired."""
+    entry = _prefetched.pop(item_id, None)
+    if entry is None:
+        return None
+    started, future = entry
+    if time.time() - started >= get_cache_ttl():
+        # Older than the cache would keep it; fetch the item again
+        future.cancel()
+        return None
+    return future
+
+def get_items(
+    item_ids: Sequence[int],
+    on_error: Optional[Callable[[int, Exception], None]] = None,
+) -> List[Optional[Story]]:
+    """Fetch several items concurrently, preserving the order of ``item_ids``.
+
+    Items that fail to load, whether from an API error or a malformed
+    payload, come back as ``None`` and ``on_error`` (if given) is called with
+    their ID and the error; one bad item never aborts the batch. Prefetched
+    items are reused, and items still fresh in the cache are built directly
+    without touching the thread pool, so a page seen recently renders with no
+    network I/O.
+    """
+    keys = [cache.cache_key("item", item_id) for item_id in item_ids]
+    cached = cache.get_many(keys, ttl=get_cache_ttl())
+    futures: Dict[int, "Future[Story]"] = {}
+    for item_id, key in zip(item_ids, keys):
+        if item_id in futures:
+            continue
+        future = _take_prefetched(item_id)
+        if future is None and key not in cached:
+            future = _executor.submit(get_item, item_id)
+        if future is not None:
+            futures[item_id] = future
+    items: List[Optional[Story]] = []
+    for item_id, key in zip(item_ids, keys):
+        future = futures.get(item_id)
+        try:
+            if future is None:
+                items.append(_item_from_result(item_id, cached[key]))
+            else:
+                items.append(future.result())
+        except Exception as exc:
+            if on_error is not None:
+                on_error(item_id, exc)
+            items.append(None)
+    return items
+
+def get_user(username: str) -> Optional[User]:
+    """Get a user profile by username, or ``None`` if it does not exist."""
+    result = _fetch_json(
+        f"{USER_URL}/{username}.json",
+        cache.cache_key("user", username),
+        f"Failed to fetch user {username}",
+    )
+    if result is None:
+        return None
+    return User.from_api(result)
+
+# (upper bound in seconds, seconds per unit, label) for format_time_ago.
+# Months are 30 days and years are 12 such months.
+_TIME_BUCKETS = (
+    (60, 1, "seconds"),
+    (3600, 60, "minutes"),
+    (86400, 3600, "hours"),
+    (2592000, 86400, "days"),
+    (31104000, 2592000, "months"),
+)
+_SECONDS_PER_YEAR = 31104000
+
+def _format_elapsed(seconds_ago: int) -> str:
+    for threshold, divisor, label in _TIME_BUCKETS:
+        if seconds_ago < threshold:
+            return f"{seconds_ago // divisor} {label} ago"
+    return f"{seconds_ago // _SECONDS_PER_YEAR} years ago"
+
+@functools.lru_cache(maxsize=4096)
+def _format_elapsed_cached(minutes_ago: int) -> str:
+    # Only used from an hour up, where every bucket divisor and threshold is a
+    # multiple of 60, so formatting whole minutes is exact
+    return _format_elapsed(minutes_ago * 60)
+
+def format_time_ago(timestamp: int, now: Optional[float] = None) -> str:
+    """Format a Unix timestamp as a human-readable time ago string.
+
+    Callers rendering many items can pass a shared ``now`` (as returned by
+    ``time.time()``) instead of reading the clock once per item. Anything
+    older than an hour is memoized by whole minutes elapsed, so re-rendering
+    the same stories and comments reuses the formatted strings.
+    """
+    if now is None:
+        now = time.time()
+    seconds_ago = int(now - timestamp)
+    if seconds_ago < 3600:
+        # Seconds and minutes change too quickly to be worth caching
+        return _format_elapsed(seconds_ago)
+    return _format_elapsed_cached(seconds_ago // 60)
+
+# Paragraph tags become blank lines; all other markup is dropped.
+_TAG_RE = re.compile(r"<p>|</p>|<[^>]+>")
+_html_unescape = html.unescape
+
+def _replace_tag(match: "re.Match[str]") -> str:
+    return "\n\n" if match.group(0) == "<p>" else ""
+
+def html_to_text(text: str) -> str:
+    """Convert the HTML used in HN comments and profiles to plain text.
+
+    Tags are stripped in a single regex pass before entities are unescaped,
+    so escaped text such as ``&lt;code&gt;`` survives as literal ``<code>``.
+
+    >>> html_to_text("it&#x27;s <i>me</i>")
+    "it's me"
+    """
+    return _html_unescape(_TAG_RE.sub(_replace_tag, text))
+
+def compile_query(query: str) -> Callable[[str], bool]:
+    """Build a case-insensitive matcher for a search query.
+
+    A story matches when every whitespace-separated term of ``query`` occurs
+    in the haystack. A single term is a plain substring test; several terms
+    are checked together with one precompiled pattern of lookaheads, so the
+    haystack is scanned in C instead of once per term from Python. The
+    haystack must already be casefolded.
+
+    >>> matches = compile_query("Rust compiler")
+    >>> matches("the compiler is written in rust"), matches("rust only")
+    (True, False)
+    """
+    terms = list(dict.fromkeys(query.casefold().split()))
+    if len(terms) <= 1:
+        term = terms[0] if terms else ""
+        return lambda haystack: term in haystack
+    pattern = re.compile("".join(f"(?=.*?{re.escape(term)})" for term in terms), re.DOTALL)
+    return lambda haystack: pattern.match(haystack) is not None
 
 def truncate_text(text: str, max_length: int = 80) -> str:
     """Truncate text to a maximum length."""
@@ -151,26 +366,78 @@ def truncate_text(text: str, max_length: int = 80) -> str:
         return text[:max_length-3] + "..."
     return text or ""
 
+@functools.lru_cache(maxsize=2048)
+def _domain(url: Optional[str]) -> str:
+    """Extract the host name shown next to a story link.
+
+    >>> _domain("https://example.com/post?id=1")
+    'example.com'
+    >>> _domain(None)
+    ''
+    """
+    return urlsplit(url).netloc if url else ""
+
+# Terminal size cached between resizes. Only used where SIGWINCH tells us
+# about resizes; elsewhere the size is queried on every call. The handler is
+# installed by the first lookup (None until then), not on import, and passes
+# each signal on to whatever handler it replaced.
+_terminal_size: Optional[Tuple[int, int]] = None
+_watching_resizes: Optional[bool] = None
+_previous_resize_handler: Any = None
+
+def _forget_terminal_size(signum: int, frame: Any) -> None:
+    global _terminal_size
+    _terminal_size = None
+    if callable(_previous_resize_handler):
+        _previous_resize_handler(signum, frame)
+
+def _watch_resizes() -> bool:
+    """Install the SIGWINCH handler on first use and report whether it is active."""
+    global _watching_resizes, _previous_resize_handler
+    if _watching_resizes is None:
+        if not hasattr(signal, "SIGWINCH"):
+            _watching_resizes = False
+            return False
+        try:
+            _previous_resize_handler = signal.signal(signal.SIGWINCH, _forget_terminal_size)
+        except ValueError:
+            # Signal handlers can only be installed from the main thread;
+            # try again on the next lookup
+            return False
+        _watching_resizes = True
+    return _watching_resizes
+
 def get_terminal_size() -> Tuple[int, int]:
     """Get the current terminal size."""
+    global _terminal_size
+    if _terminal_size is not None:
+        return _terminal_size
     try:
         # Get terminal size
         columns, rows = shutil.get_terminal_size()
-        return columns, rows
     except Exception:
         # Default to standard size if detection fails
-        return 80, 24
+        columns, rows = 80, 24
+    if _watch_resizes():
+        _terminal_size = (columns, rows)
+    return columns, rows
 
-def calculate_stories_per_page() -> int:
+def calculate_stories_per_page(size: Optional[Tuple[int, int]] = None) -> int:
     """
     Calculate how many stories to display per page based on terminal size.
 
     Calculates available rows after reserving lines for interface elements
     (banner, header, blank lines, navigation menu) and clamps the result
-    between 10 and 20 stories per page for optimal readability.
+    between 10 and 20 stories per page for optimal readability. Callers that
+    already have the ``(columns, rows)`` size for this render pass can pass
+    it in instead of querying the terminal again.
     """
     # Determine terminal height and estimate available rows for stories
-    _, rows = get_terminal_size()
+    _, rows = size if size is not None else get_terminal_size()
+    return _stories_per_page_for_rows(rows)
+
+@functools.lru_cache(maxsize=4)
+def _stories_per_page_for_rows(rows: int) -> int:
     # Reserve lines for interface elements (banner/title, table header,
     # blank lines, and navigation menu).
     RESERVED_ROWS = 8
@@ -189,15 +456,12 @@ def calculate_stories_per_page() -> int:
 def display_story(story: Story, show_index: Optional[int] = None) -> None:
     """Display a story in a rich panel."""
     title = story.get("title", "No title")
-    url = story.get("url", f"{HN_WEB_URL}/item?id={story['id']}")
+    url = story.get("url") or HN_ITEM_URL + str(story.get("id"))
     points = story.get("score", 0)
     author = story.get("by", "unknown")
     comments_count = len(story.get("kids", []))
     time_ago = format_time_ago(story.get("time", 0))
-    
-    domain = ""
-    if url and "://" in url:
-        domain = url.split("://")[1].split("/")[0]
+    domain = _domain(url)
     
     # Make the story title itself clickable. For panels (single‑story
     # view) we rely on Rich markup to apply both the *bold* style and the
@@ -213,16 +477,20 @@ def display_story(story: Story, show_index: Optional[int] = None) -> None:
     content += f"\n{points} points by {author} {time_ago} | {comments_count} comments"
     
     panel = Panel(content, expand=False)
-    console.print(panel)
+    get_console().print(panel)
 
-def display_stories(stories: List[Story]) -> None:
-    """Display a list of stories in a compact table format."""
+def display_stories(stories: List[Story], size: Optional[Tuple[int, int]] = None) -> None:
+    """Display a list of stories in a compact table format.
+
+    ``size`` is the terminal size to lay the table out for; it is queried
+    when not given.
+    """
 
     if not stories:
-        console.print("No stories to display.")
+        get_console().print("No stories to display.")
         return
 
-    columns, _ = get_terminal_size()
+    columns, _ = size if size is not None else get_terminal_size()
 
     table = Table(show_header=True, header_style="bold", expand=False)
     table.add_column("#", style="dim", width=4, no_wrap=True)
@@ -237,53 +505,90 @@ def display_stories(stories: List[Story]) -> None:
     table.add_column("Cmts", justify="right", width=9, no_wrap=True)
     table.add_column("Age", style="dim", width=12, no_wrap=True)
 
+    now = time.time()
+    # Hoisted out of the row loop
+    _escape = escape
+    item_url = HN_ITEM_URL
+    add_row = table.add_row
     for idx, story in enumerate(stories, 1):
         title = story.get("title", "No title")
-        url = story.get("url", f"{HN_WEB_URL}/item?id={story['id']}")
-        domain = ""
-        if url and "://" in url:
-            domain = url.split("://")[1].split("/")[0]
-        title_text = escape(title)
-        domain_text = escape(domain)
-
-        title_markup = f"[link={url}]{title_text}[/link]"
+        url = story.get("url") or item_url + str(story.get("id"))
+        domain = _domain(url)
+
+        title_markup = f"[link={url}]{_escape(title)}[/link]"
         if domain:
-            title_markup += f" ({domain_text})"
+            title_markup += f" ({_escape(domain)})"
 
         points = str(story.get("score", 0))
         comments_count = str(len(story.get("kids", [])))
-        age = format_time_ago(story.get("time", 0))
+        age = format_time_ago(story.get("time", 0), now)
 
-        table.add_row(str(idx), title_markup, points, comments_count, age)
+        add_row(str(idx), title_markup, points, comments_count, age)
 
-    console.print(table)
+    get_console().print(table)
 
-def display_comment(comment: Story, indent_level: int = 0) -> None:
+# Indentation for nested comments, two spaces per level, built once
+_INDENTS = tuple("  " * depth for depth in range(128))
+
+def comment_indent(depth: int) -> str:
+    """Get the indentation prefix for a comment at ``depth``."""
+    return _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+
+@functools.lru_cache(maxsize=256)
+def comment_wrapper(depth: int, columns: int) -> textwrap.TextWrapper:
+    """Get a reusable wrapper that fits and indents comment text at ``depth``.
+
+    Text is wrapped to at most 100 characters, leaving room for the indent
+    and a small margin, but never narrower than 20 characters.
+    """
+    indent = comment_indent(depth)
+    wrap_width = max(min(100, columns - len(indent) - 5), 20)  # Account for indent and margin
+    return textwrap.TextWrapper(
+        width=wrap_width + len(indent),
+        initial_indent=indent,
+        subsequent_indent=indent,
+    )
+
+def display_comment(comment: Story, indent_level: int = 0, now: Optional[float] = None) -> None:
     """Display a comment with appropriate indentation."""
     if comment.get("deleted") or comment.get("dead"):
         return
     
     author = comment.get("by", "unknown")
-    time_ago = format_time_ago(comment.get("time", 0))
-    text = comment.get("text", "")
-    
-    # Process HTML in comment text
-    import html
-    text = html.unescape(text)
-    # Remove HTML tags (basic implementation, can be improved)
-    text = text.replace("<p>", "\n\n").replace("</p>", "")
+    time_ago = format_time_ago(comment.get("time", 0), now)
+    text = html_to_text(comment.get("text") or "")
     
-    indent = "  " * indent_level
+    indent = comment_indent(indent_level)
     header = f"{indent}[bold]{author}[/bold] {time_ago}"
-    console.print(header)
     
     # Wrap and indent comment text
     columns, _ = get_terminal_size()
-    wrap_width = min(100, columns - len(indent) - 5)  # Account for indent and margin
-    wrapped_text = textwrap.fill(text, width=wrap_width)
-    wrapped_text = "\n".join(f"{indent}{line}" for line in wrapped_text.split("\n"))
-    console.print(wrapped_text)
-    console.print("")
+    wrapped_text = comment_wrapper(indent_level, columns).fill(text)
+    # Header, body and trailing blank line go out in a single write
+    get_console().print(f"{header}\n{wrapped_text}\n")
+
+# Raw key presses understood by the comment browser (matched lowercased)
+_KEY_NAMES = {
+    b"\x1b[a": "UP",
+    b"\x1b[b": "DOWN",
+    b"\r": "ENTER",
+    b"\n": "ENTER",
+    b"q": "QUIT",
+    b"b": "BACK",
+}
+
+def parent_comment_ids(story: Story, max_comments: Optional[int] = None) -> List[int]:
+    """Get the IDs of the top-level comments the comment view will show."""
+    parent_ids = story.get("kids", [])
+
+    # Determine number of parent comments to display
+    if max_comments is not None:
+        # Use user-specified limit
+        return parent_ids[:max_comments]
+    # Limit based on terminal size (between 5 and 10)
+    _, rows = get_terminal_size()
+    max_parents = max(5, min(10, rows - 5))
+    return parent_ids[:max_parents]
 
 def display_comments(story: Story, max_comments: int = None) -> None:
     """
@@ -293,102 +598,88 @@ def display_comments(story: Story, max_comments: int = None) -> None:
     or a custom limit can be specified via the --comments option.
     """
     parent_ids = story.get("kids", [])
-    console.print(f"\n[bold]Comments for: {story.get('title', 'Unknown Story')}[/bold]\n")
+    get_console().print(f"\n[bold]Comments for: {story.get('title', 'Unknown Story')}[/bold]\n")
     if not parent_ids:
-        console.print("No comments yet.")
+        get_console().print("No comments yet.")
         return
 
-    # Determine number of parent comments to display
-    if max_comments is not None:
-        # Use user-specified limit
-        parent_ids = parent_ids[:max_comments]
-    else:
-        # Limit based on terminal size (between 5 and 10)
-        _, rows = get_terminal_size()
-        max_parents = max(5, min(10, rows - 5))
-        parent_ids = parent_ids[:max_parents]
+    parent_ids = parent_comment_ids(story, max_comments)
 
     # Pre-fetch parent comments for summaries
-    parent_comments = []
-    for cid in parent_ids:
-        try:
-            comment = get_item(cid)
-            if comment and not comment.get("deleted") and not comment.get("dead"):
-                parent_comments.append(comment)
-        except Exception:
-            pass
+    parent_comments = [
+        comment for comment in get_items(parent_ids)
+        if comment and not comment.get("deleted") and not comment.get("dead")
+    ]
 
-    def read_single_keypress():
-        import sys, termios, tty
+    def get_key():
+        import os, select, termios, tty
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
+            # Enter raw mode once per key press, not once per byte
             tty.setraw(fd)
-            ch = sys.stdin.read(1)
+            key = os.read(fd, 1)
+            if key == b"\x1b" and select.select([fd], [], [], 0.05)[0]:
+                # Arrow keys arrive as ESC [ A/B; a lone ESC has nothing after it
+                key += os.read(fd, 2)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
-
-    def get_key():
-        key = read_single_keypress()
-        if key == "\x1b":
-            # Arrow keys start with ESC sequence
-            next1 = read_single_keypress()
-            if next1 == "[":
-                next2 = read_single_keypress()
-                if next2 == "A":
-                    return "UP"
-                elif next2 == "B":
-                    return "DOWN"
-            return None
-        elif key in ("\r", "\n"):
-            return "ENTER"
-        elif key.lower() == "q":
-            return "QUIT"
-        elif key.lower() == "b":
-            return "BACK"
-        return None
-
-    def strip_html_tags(text: str) -> str:
-        return re.sub(r"<[^>]+>", "", text)
+        return _KEY_NAMES.get(key.lower())
 
     def get_summary_text(comment: dict, length: int = 80) -> str:
-        import html
-        text = html.unescape(comment.get("text", "") or "")
-        text = strip_html_tags(text).replace("\n", " ")
+        # Collapse paragraph breaks and wrapping into single spaces
+        text = " ".join(html_to_text(comment.get("text") or "").split())
         return truncate_text(text, length)
 
+    def fetch_thread(root: Story) -> Dict[int, List[Story]]:
+        """Fetch the thread under ``root`` level by level.
+
+        All comments at one depth are requested as a single concurrent
+        batch before moving on to the next depth, so siblings never wait on
+        each other's descendants. Returns the visible children of every
+        fetched comment keyed by parent ID, in API order.
+        """
+        children: Dict[int, List[Story]] = {}
+        level = [root]
+        while level:
+            kid_ids = [parent.get("kids") or [] for parent in level]
+            fetched = iter(get_items([kid for kids in kid_ids for kid in kids]))
+            next_level = []
+            for parent, kids in zip(level, kid_ids):
+                visible = [
+                    child for child in itertools.islice(fetched, len(kids))
+                    if child and not child.get("deleted") and not child.get("dead")
+                ]
+                children[parent.id] = visible
+                next_level.extend(visible)
+            level = next_level
+        return children
+
     def expand_comment_tree(comment):
         # Flatten the comment thread into lines for interactive scrolling
         lines: List[str] = []
-        import html
+        now = time.time()
+        children = fetch_thread(comment)
+        cols, _ = get_terminal_size()
 
         def collect(cmt: Story, depth: int):
-            if not cmt or cmt.get("deleted") or cmt.get("dead"):
-                return
             author = cmt.get("by", "unknown")
-            time_ago = format_time_ago(cmt.get("time", 0))
-            indent = "  " * depth
+            time_ago = format_time_ago(cmt.get("time", 0), now)
+            indent = comment_indent(depth)
             header = f"{indent}[bold]{author}[/bold] {time_ago}"
             lines.append(header)
-            # Process and wrap text
-            text = html.unescape(cmt.get("text", "") or "")
-            text = text.replace("<p>", "\n\n").replace("</p>", "")
-            text = strip_html_tags(text)
-            cols, _ = get_terminal_size()
-            wrap_width = min(100, cols - len(indent) - 5)
-            wrapped = textwrap.fill(text, width=wrap_width)
-            for ln in wrapped.split("\n"):
-                lines.append(f"{indent}{ln}")
+            # Process, wrap and indent text
+            text = html_to_text(cmt.get("text") or "")
+            lines.extend(comment_wrapper(depth, cols).wrap(text) or [indent])
             lines.append("")
-            for kid in cmt.get("kids", []):
-                try:
-                    child = get_item(kid)
-                    collect(child, depth + 1)
-                except Exception:
-                    continue
 
-        collect(comment, 0)
+        # Walk the fetched tree depth-first with an explicit stack so very
+        # deep threads cannot hit the recursion limit
+        stack = [(comment, 0)]
+        while stack:
+            cmt, depth = stack.pop()
+            collect(cmt, depth)
+            stack.extend((child, depth + 1) for child in reversed(children.get(cmt.id, [])))
         # Interactive scroll through the collected lines
         offset = 0
         _, rows = get_terminal_size()
@@ -397,9 +688,8 @@ def display_comments(story: Story, max_comments: int = None) -> None:
         max_offset = max(len(lines) - view_height, 0)
         while True:
             clear_screen()
-            for ln in lines[offset: offset + view_height]:
-                console.print(ln)
-            console.print("[grey]Use ↑/↓ to scroll, any other key to return[/grey]")
+            get_console().print("\n".join(lines[offset: offset + view_height]))
+            get_console().print("[grey]Use ↑/↓ to scroll, any other key to return[/grey]")
             key = get_key()
             if key == "UP":
                 offset = max(0, offset - 1)
@@ -412,14 +702,19 @@ def display_comments(story: Story, max_comments: int = None) -> None:
     selected = 0
     while True:
         clear_screen()
-        console.print(f"[bold]Comments for: {story.get('title', 'Unknown Story')}[/bold]")
-        console.print("[grey]Use ↑/↓ to navigate, Enter to expand, b to go back, q to quit[/grey]\n")
+        get_console().print(f"[bold]Comments for: {story.get('title', 'Unknown Story')}[/bold]")
+        get_console().print("[grey]Use ↑/↓ to navigate, Enter to expand, b to go back, q to quit[/grey]\n")
+        now = time.time()
+        rows = []
         for idx, comment in enumerate(parent_comments):
             author = comment.get("by", "unknown")
-            time_ago = format_time_ago(comment.get("time", 0))
+            time_ago = format_time_ago(comment.get("time", 0), now)
             summary = get_summary_text(comment)
             prefix = "→" if idx == selected else "  "
-            console.print(f"{prefix} [{idx+1}] {author} {time_ago}: {summary}")
+            rows.append(f"{prefix} [{idx+1}] {author} {time_ago}: {summary}")
+        # Render the whole list with one print instead of one per comment
+        if rows:
+            get_console().print("\n".join(rows))
         key = get_key()
         if key == "UP":
             selected = (selected - 1) % len(parent_comments)
@@ -431,14 +726,20 @@ def display_comments(story: Story, max_comments: int = None) -> None:
             break
 
 def clear_screen():
-    """Clear the terminal screen based on OS."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen.
+
+    Rich writes the escape sequence directly (and handles Windows), which is
+    much cheaper than spawning a shell for ``clear``/``cls`` on every redraw.
+    """
+    get_console().clear()
 
 def show_navigation_menu(story_type: str, page: int, total_pages: int, story_count: int) -> str:
     """Show navigation menu and return user command."""
-    console.print("\n--- Navigation ---")
-    console.print(f"Page {page}/{total_pages} ({story_count} stories total)")
-    console.print("[n] Next page | [p] Previous page | [#] Select story | [r] Refresh | [q] Quit")
+    get_console().print("\n--- Navigation ---")
+    get_console().print(f"Page {page}/{total_pages} ({story_count} stories total)")
+    get_console().print("[n] Next page | [p] Previous page | [#] Select story | [r] Refresh | [q] Quit")
+    # Only the interactive browser prompts, so other commands skip this import
+    from rich.prompt import Prompt
     return Prompt.ask("Enter command", default="n")
 
 def handle_story_viewing(story: Story, max_comments: int = None) -> None:
@@ -449,6 +750,8 @@ def handle_story_viewing(story: Story, max_comments: int = None) -> None:
     """
 
     clear_screen()
+    # Start on the top-level comments while the story panel renders
+    prefetch_items(parent_comment_ids(story, max_comments))
     display_story(story)
     display_comments(story, max_comments)
 
@@ -460,24 +763,25 @@ def browse_stories(story_type: str, stories_per_page: int = None) -> None:
         # Dynamically calculate stories per page based on terminal size
         stories_per_page = calculate_stories_per_page()
     
-    with console.status(f"Fetching {story_type} stories..."):
+    with get_console().status(f"Fetching {story_type} stories..."):
         try:
             story_ids = get_story_ids(story_type)
             total_stories = len(story_ids)
         except APIRequestError as e:
-            console.print(f"Error fetching {story_type} stories: {e}")
+            get_console().print(f"Error fetching {story_type} stories: {e}")
             return
     
     current_page = 1
     total_pages = (total_stories + stories_per_page - 1) // stories_per_page
     
     while True:
-        # Recalculate stories per page in case terminal has been resized
-        if stories_per_page == calculate_stories_per_page():
+        # Recalculate stories per page in case terminal has been resized;
+        # the whole render pass then uses the same size
+        size = get_terminal_size()
+        new_stories_per_page = calculate_stories_per_page(size)
+        if new_stories_per_page != stories_per_page:
             # Only recalculate total pages if the stories per page value changed
-            pass
-        else:
-            stories_per_page = calculate_stories_per_page()
+            stories_per_page = new_stories_per_page
             total_pages = (total_stories + stories_per_page - 1) // stories_per_page
             # Adjust current page if needed
             current_page = min(current_page, total_pages)
@@ -488,22 +792,25 @@ def browse_stories(story_type: str, stories_per_page: int = None) -> None:
         
         # Fetch and display current page of stories
         stories = []
-        with console.status(f"Loading page {current_page}..."):
-            for story_id in story_ids[start_idx:end_idx]:
-                try:
-                    story = get_item(story_id)
-                    if story and story.get("type") == "story":
-                        stories.append(story)
-                except APIRequestError as e:
-                    console.print(f"Error fetching story {story_id}: {e}")
+        with get_console().status(f"Loading page {current_page}..."):
+            for story in get_items(
+                story_ids[start_idx:end_idx],
+                on_error=lambda story_id, e: get_console().print(f"Error fetching story {story_id}: {e}"),
+            ):
+                if story and story.get("type") == "story":
+                    stories.append(story)
         
-        columns, _ = get_terminal_size()
+        columns, _ = size
         title = f"{story_type.capitalize()} Stories (Page {current_page}/{total_pages})"
         padding = max(0, (columns - len(title) - 2) // 2)
         centered_title = " " * padding + title
         
-        console.print(f"\n[bold]{centered_title}[/bold]\n")
-        display_stories(stories)
+        get_console().print(f"\n[bold]{centered_title}[/bold]\n")
+        display_stories(stories, size)
+
+        # Fetch the next page while the user is reading this one
+        if current_page < total_pages:
+            prefetch_items(story_ids[end_idx:end_idx + stories_per_page])
         
         # Show navigation menu
         command = show_navigation_menu(story_type, current_page, total_pages, total_stories)
@@ -517,14 +824,15 @@ def browse_stories(story_type: str, stories_per_page: int = None) -> None:
                 current_page -= 1
         elif command.lower() == 'r':
             # Refresh the current page
+            _prefetched.clear()
             cache.clear()
-            with console.status(f"Refreshing {story_type} stories..."):
+            with get_console().status(f"Refreshing {story_type} stories..."):
                 try:
                     story_ids = get_story_ids(story_type)
                     total_stories = len(story_ids)
                     total_pages = (total_stories + stories_per_page - 1) // stories_per_page
                 except APIRequestError as e:
-                    console.print(f"Error refreshing {story_type} stories: {e}")
+                    get_console().print(f"Error refreshing {story_type} stories: {e}")
                     continue
         elif command.lower() == 'q':
             break
@@ -533,7 +841,7 @@ def browse_stories(story_type: str, stories_per_page: int = None) -> None:
             if 1 <= idx <= len(stories):
                 handle_story_viewing(stories[idx-1])
             else:
-                console.print(f"[red]Invalid story number. Choose between 1 and {len(stories)}.[/red]")
+                get_console().print(f"[red]Invalid story number. Choose between 1 and {len(stories)}.[/red]")
 
 @app.command()
 def top(limit: int = None) -> None:
@@ -561,14 +869,14 @@ def story(
     ),
 ) -> None:
     """Show a specific story and its comments."""
-    with console.status(f"Fetching story {item_id}..."):
+    with get_console().status(f"Fetching story {item_id}..."):
         try:
             story = get_item(item_id)
-            if not story:
-                console.print(f"Story {item_id} not found.")
+            if not story or story.get("deleted"):
+                get_console().print(f"Story {item_id} not found.")
                 return
         except APIRequestError as e:
-            console.print(f"Error fetching story {item_id}: {e}")
+            get_console().print(f"Error fetching story {item_id}: {e}")
             return
     
     handle_story_viewing(story, comments)
@@ -576,24 +884,22 @@ def story(
 @app.command()
 def user(username: str) -> None:
     """Show a user profile."""
-    with console.status(f"Fetching user {username}..."):
+    with get_console().status(f"Fetching user {username}..."):
         try:
             user_data = get_user(username)
             if not user_data:
-                console.print(f"User {username} not found.")
+                get_console().print(f"User {username} not found.")
                 return
         except APIRequestError as e:
-            console.print(f"Error fetching user {username}: {e}")
+            get_console().print(f"Error fetching user {username}: {e}")
             return
     
     created = format_time_ago(user_data.get("created", 0))
     karma = user_data.get("karma", 0)
-    about = user_data.get("about", "No information provided.")
+    about = user_data.get("about") or "No information provided."
     
     # Remove HTML from about
-    import html
-    about = html.unescape(about)
-    about = about.replace("<p>", "\n\n").replace("</p>", "")
+    about = html_to_text(about)
     
     user_table = Table(show_header=False)
     user_table.add_column("Field")
@@ -604,15 +910,16 @@ def user(username: str) -> None:
     user_table.add_row("Karma", str(karma))
     user_table.add_row("About", about)
     
-    console.print(Panel(user_table, title=f"[bold]User Profile: {username}[/bold]"))
+    get_console().print(Panel(user_table, title=f"[bold]User Profile: {username}[/bold]"))
     
     # Automatically open in browser based on configuration
-    if get_config_value("open_links_in_browser", True):
-        webbrowser.open(f"{HN_WEB_URL}/user?id={username}")
+    profile_url = HN_USER_URL + username
+    if get_settings().open_links_in_browser:
+        webbrowser.open(profile_url)
     else:
         # Ask if user wants to open in browser when automatic opening is disabled
-        if typer.confirm("\nOpen user profile in browser?"):
-            webbrowser.open(f"{HN_WEB_URL}/user?id={username}")
+        if _confirm("\nOpen user profile in browser?"):
+            webbrowser.open(profile_url)
 
 @app.command()
 def search(query: str, limit: int = None) -> None:
@@ -626,43 +933,84 @@ def search(query: str, limit: int = None) -> None:
         limit = calculate_stories_per_page()
         
     query = query.lower()
+    matches_query = compile_query(query)
     
-    with console.status(f"Searching for '{query}'..."):
+    with get_console().status(f"Searching for '{query}'..."):
         # Fetch stories from different categories to search through
+        # concurrently; the three listings are independent requests
+        story_types = ["top", "new", "best"]
+        listings = [_executor.submit(get_story_ids, story_type) for story_type in story_types]
+        # Duplicates across categories are dropped as we go, keeping the
+        # API's ranking order so better-ranked stories are searched first
         all_story_ids = []
-        for story_type in ["top", "new", "best"]:
+        seen = set()
+        for story_type, listing in zip(story_types, listings):
             try:
-                all_story_ids.extend(get_story_ids(story_type)[:100])  # Get first 100 from each category
+                ids = listing.result()[:100]  # Get first 100 from each category
             except APIRequestError as e:
-                console.print(f"Error fetching {story_type} stories: {e}")
-        
-        # Remove duplicates
-        all_story_ids = list(set(all_story_ids))
+                get_console().print(f"Error fetching {story_type} stories: {e}")
+                continue
+            for story_id in ids:
+                if story_id not in seen:
+                    seen.add(story_id)
+                    all_story_ids.append(story_id)
         
-        # Search through stories
-        matching_stories = []
-        for story_id in all_story_ids:
-            if len(matching_stories) >= 100:  # Limit to 100 matches max for pagination
-                break
-            
-            try:
-                story = get_item(story_id)
+        # Search through stories, fetching candidates concurrently. Only a
+        # window of fetches is kept in flight and it is refilled as results
+        # arrive. Once enough matches are found nothing new is requested, but
+        # fetches that could still outrank the worst kept match are awaited,
+        # so the results are the best-ranked matches, not the fastest ones.
+        # Limit to 100 matches max for pagination; no limit (0) means that
+        # cap, and a negative limit still keeps the single best match
+        max_matches = max(1, min(limit, 100)) if limit else 100
+        candidates = iter(enumerate(all_story_ids))
+        pending: Dict["Future[Story]", int] = {}
+
+        def submit_candidates(count: int) -> None:
+            for rank, story_id in itertools.islice(candidates, count):
+                pending[_executor.submit(get_item, story_id)] = rank
+
+        submit_candidates(MAX_FETCH_WORKERS)
+        # Best matches so far as (rank, story), kept sorted by rank
+        matches: List[Tuple[int, Story]] = []
+        while pending:
+            full = bool(matches) and len(matches) >= max_matches
+            if full:
+                worst_rank = matches[-1][0]
+                contenders = [future for future, rank in pending.items() if rank < worst_rank]
+                if not contenders:
+                    break
+            else:
+                contenders = list(pending)
+            done, _ = wait(contenders, return_when=FIRST_COMPLETED)
+            if not full:
+                # Later candidates are all ranked below everything kept so
+                # far, so the window is only refilled while matches are short
+                submit_candidates(len(done))
+            for future in done:
+                rank = pending.pop(future)
+                try:
+                    story = future.result()
+                except APIRequestError:
+                    # Silently ignore errors during search
+                    continue
                 if story and story.get("type") == "story":
-                    title = story.get("title", "").lower()
-                    text = story.get("text", "").lower()
-
-                    if query in title or query in text:
-                        matching_stories.append(story)
-            except APIRequestError:
-                # Silently ignore errors during search
-                pass
-
-        if limit:
-            matching_stories = matching_stories[:limit]
+                    haystack = f"{story.get('title') or ''}\n{story.get('text') or ''}".casefold()
+                    if matches_query(haystack):
+                        matches.append((rank, story))
+            # Completion order is arbitrary; keep the best-ranked matches
+            matches.sort(key=lambda match: match[0])
+            del matches[max_matches:]
+        # Drop fetches that have not started yet; requests already in flight
+        # finish and just populate the cache
+        for future in pending:
+            future.cancel()
+
+        matching_stories = [story for _, story in matches]
     
     if not matching_stories:
-        console.print(f"\n[bold]Search Results for '{query}'[/bold]\n")
-        console.print("No matching stories found.")
+        get_console().print(f"\n[bold]Search Results for '{query}'[/bold]\n")
+        get_console().print("No matching stories found.")
         return
         
     # Display stories with interactive browsing
@@ -672,12 +1020,13 @@ def search(query: str, limit: int = None) -> None:
     total_pages = (total_stories + stories_per_page - 1) // stories_per_page
     
     while True:
-        # Recalculate stories per page in case terminal has been resized
-        if stories_per_page == calculate_stories_per_page():
+        # Recalculate stories per page in case terminal has been resized;
+        # the whole render pass then uses the same size
+        size = get_terminal_size()
+        new_stories_per_page = calculate_stories_per_page(size)
+        if new_stories_per_page != stories_per_page:
             # Only recalculate total pages if the stories per page value changed
-            pass
-        else:
-            stories_per_page = calculate_stories_per_page()
+            stories_per_page = new_stories_per_page
             total_pages = (total_stories + stories_per_page - 1) // stories_per_page
             # Adjust current page if needed
             current_page = min(current_page, total_pages)
@@ -686,13 +1035,13 @@ def search(query: str, limit: int = None) -> None:
         start_idx = (current_page - 1) * stories_per_page
         end_idx = min(start_idx + stories_per_page, total_stories)
         
-        columns, _ = get_terminal_size()
+        columns, _ = size
         title = f"Search Results for '{query}' (Page {current_page}/{total_pages})"
         padding = max(0, (columns - len(title) - 2) // 2)
         centered_title = " " * padding + title
         
-        console.print(f"\n[bold]{centered_title}[/bold]\n")
-        display_stories(matching_stories[start_idx:end_idx])
+        get_console().print(f"\n[bold]{centered_title}[/bold]\n")
+        display_stories(matching_stories[start_idx:end_idx], size)
         
         # Show navigation menu
         command = show_navigation_menu("search", current_page, total_pages, total_stories)
@@ -714,19 +1063,19 @@ def search(query: str, limit: int = None) -> None:
             if 1 <= idx <= len(matching_stories[start_idx:end_idx]):
                 handle_story_viewing(matching_stories[start_idx + idx - 1])
             else:
-                console.print(f"[red]Invalid story number. Choose between 1 and {len(matching_stories[start_idx:end_idx])}.[/red]")
+                get_console().print(f"[red]Invalid story number. Choose between 1 and {len(matching_stories[start_idx:end_idx])}.[/red]")
 
 @app.command()
 def open(story_id: int) -> None:
     """Open a story in the web browser."""
-    url = f"{HN_WEB_URL}/item?id={story_id}"
-    if get_config_value("open_links_in_browser", True):
+    url = HN_ITEM_URL + str(story_id)
+    if get_settings().open_links_in_browser:
         webbrowser.open(url)
-        console.print(f"Opening story {story_id} in browser...")
+        get_console().print(f"Opening story {story_id} in browser...")
     else:
-        if typer.confirm("Open story in browser?"):
+        if _confirm("Open story in browser?"):
             webbrowser.open(url)
-            console.print(f"Opening story {story_id} in browser...")
+            get_console().print(f"Opening story {story_id} in browser...")
 
 @app.command()
 def config_set(key: str, value: str) -> None:
@@ -742,9 +1091,9 @@ def config_set(key: str, value: str) -> None:
     
     try:
         config.update_setting(key, value)
-        console.print(f"[green]Updated {key} to {value}[/green]")
+        get_console().print(f"[green]Updated {key} to {value}[/green]")
     except Exception as e:
-        console.print(f"[red]Error updating setting: {e}[/red]")
+        get_console().print(f"[red]Error updating setting: {e}[/red]")
 
 @app.command()
 def config_get(key: Optional[str] = None) -> None:
@@ -752,9 +1101,9 @@ def config_get(key: Optional[str] = None) -> None:
     if key:
         try:
             value = config.get_setting(key)
-            console.print(f"{key}: {value}")
+            get_console().print(f"{key}: {value}")
         except Exception as e:
-            console.print(f"[red]Error getting setting: {e}[/red]")
+            get_console().print(f"[red]Error getting setting: {e}[/red]")
     else:
         try:
             all_config = config.load_config()
@@ -766,27 +1115,28 @@ def config_get(key: Optional[str] = None) -> None:
                 table.add_row(k, str(v))
             
             # Add additional information about adaptive display
-            table.add_row("Terminal Size", f"{get_terminal_size()[0]}x{get_terminal_size()[1]}")
-            table.add_row("Current Stories per Page", str(calculate_stories_per_page()))
+            size = get_terminal_size()
+            table.add_row("Terminal Size", "{}x{}".format(*size))
+            table.add_row("Current Stories per Page", str(calculate_stories_per_page(size)))
             
-            console.print(table)
+            get_console().print(table)
         except Exception as e:
-            console.print(f"[red]Error loading configuration: {e}[/red]")
+            get_console().print(f"[red]Error loading configuration: {e}[/red]")
 
 @app.command()
 def config_reset() -> None:
     """Reset configuration to defaults."""
     try:
         config.save_config(config.DEFAULT_CONFIG)
-        console.print("[green]Configuration reset to defaults[/green]")
+        get_console().print("[green]Configuration reset to defaults[/green]")
     except Exception as e:
-        console.print(f"[red]Error resetting configuration: {e}[/red]")
+        get_console().print(f"[red]Error resetting configuration: {e}[/red]")
 
 @app.command()
 def cache_clear() -> None:
     """Clear the cache to fetch fresh data."""
     cache.clear()
-    console.print("[green]Cache cleared[/green]")
+    get_console().print("[green]Cache cleared[/green]")
 
 if __name__ == "__main__":
     app() 
@@ -2,13 +2,16 @@
 Configuration settings for the Hacker News CLI.
 """
 
+import functools
 import os
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Optional
 
-# Default configuration
-DEFAULT_CONFIG = {
+from hncli import serialization
+
+# Default configuration, read-only so it can be shared without copying
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Maximum number of stories per page (actual number may be lower based on terminal size)
     "stories_per_page": 10,
     # Maximum depth of comments to display 
@@ -19,40 +22,72 @@ DEFAULT_CONFIG = {
     "color_theme": "default",
     # Cache timeout in minutes
     "cache_timeout_minutes": 5
-}
+})
+
+class ConfigBits(NamedTuple):
+    """Every setting as a plain attribute, for hot paths that read them per command.
+
+    The fields mirror the keys of ``DEFAULT_CONFIG``, in the same order.
+    """
+
+    stories_per_page: int
+    max_comment_depth: int
+    open_links_in_browser: bool
+    color_theme: str
+    cache_timeout_minutes: int
+
+# Resolved (and its directory created) on first use
+_config_path: Optional[Path] = None
 
 def get_config_path() -> Path:
-    """Get the path to the configuration file."""
-    config_dir = Path.home() / ".config" / "hncli"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / "config.json"
+    """Get the path to the configuration file, creating its directory on first call."""
+    global _config_path
+    if _config_path is None:
+        config_dir = Path.home() / ".config" / "hncli"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        _config_path = config_dir / "config.json"
+    return _config_path
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load configuration from file or create default."""
+    """Load configuration from file or create default.
+
+    The result is memoized for the lifetime of the process; ``save_config``
+    invalidates it.
+    """
     config_path = get_config_path()
     
     if config_path.exists():
         try:
-            with open(config_path, "r") as f:
-                user_config = json.load(f)
+            with open(config_path, "rb") as f:
+                user_config = serialization.loads(f.read())
                 # Update with any missing default values
-                config = DEFAULT_CONFIG.copy()
+                config = dict(DEFAULT_CONFIG)
                 config.update(user_config)
                 return config
         except Exception:
             # If there's an error loading the config, use defaults
-            return DEFAULT_CONFIG
+            return dict(DEFAULT_CONFIG)
     else:
         # Create default config file
         save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        return dict(DEFAULT_CONFIG)
 
-def save_config(config: Dict[str, Any]) -> None:
+def save_config(config: Mapping[str, Any]) -> None:
     """Save configuration to file."""
     config_path = get_config_path()
     
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=4)
+    with open(config_path, "wb") as f:
+        # Serializers only accept real dicts, not read-only views
+        f.write(serialization.dumps(dict(config), indent=True))
+    load_config.cache_clear()
+    load_settings.cache_clear()
+
+@functools.lru_cache(maxsize=1)
+def load_settings() -> ConfigBits:
+    """Load the configuration as a ``ConfigBits`` tuple, memoized like ``load_config``."""
+    config = load_config()
+    return ConfigBits(**{field: config.get(field, DEFAULT_CONFIG[field]) for field in ConfigBits._fields})
 
 def get_setting(key: str) -> Any:
     """Get a specific setting from the configuration."""
@@ -61,6 +96,6 @@ def get_setting(key: str) -> Any:
 
 def update_setting(key: str, value: Any) -> None:
     """Update a specific setting in the configuration."""
-    config = load_config()
+    config = dict(load_config())
     config[key] = value
     save_config(config) 
\ No newline at end of file
@@ -1,12 +1,36 @@
+"""Lightweight models for Hacker News API objects.
+
+API responses are trusted JSON, so the models are plain slotted dataclasses
+rather than validating models: building one is a single ``__init__`` call.
+"""
+
 from __future__ import annotations
 
-"""Pydantic models for Hacker News API objects."""
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+# ``slots`` is only accepted by ``dataclass`` from Python 3.10 on
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _APIObject:
+    """Dictionary-style access shared by the API models."""
+
+    __slots__ = ()
 
-from typing import Any, List, Optional
-from pydantic import BaseModel, ConfigDict
+    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        """Get a field like ``dict.get`` would on the API payload.
+
+        Fields the API left out are stored as ``None``, so they fall back to
+        ``default`` just like a missing key.
+        """
+        value = getattr(self, key, None)
+        return default if value is None else value
 
 
-class Story(BaseModel):
+@dataclass(**_SLOTS)
+class Story(_APIObject):
     """Representation of an item returned by the Hacker News API."""
 
     id: int
@@ -20,15 +44,20 @@ class Story(BaseModel):
     kids: Optional[List[int]] = None
     text: Optional[str] = None
     parent: Optional[int] = None
+    deleted: Optional[bool] = None
+    dead: Optional[bool] = None
+    poll: Optional[int] = None
+    parts: Optional[List[int]] = None
 
-    model_config = ConfigDict(extra="allow")
-
-    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
-        """Dictionary-style access helper."""
-        return getattr(self, key, default)
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Story":
+        """Build a story from an API payload, ignoring unknown fields."""
+        values: Dict[str, Any] = {name: data.get(name) for name in _STORY_FIELDS}
+        return cls(**values)
 
 
-class User(BaseModel):
+@dataclass(**_SLOTS)
+class User(_APIObject):
     """Representation of a user profile returned by the Hacker News API."""
 
     id: str
@@ -37,8 +66,15 @@ class User(BaseModel):
     about: Optional[str] = None
     submitted: Optional[List[int]] = None
 
-    model_config = ConfigDict(extra="allow")
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "User":
+        """Build a user from an API payload, ignoring unknown fields."""
+        values: Dict[str, Any] = {name: data.get(name) for name in _USER_FIELDS}
+        return cls(**values)
 
-    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
-        """Dictionary-style access helper."""
-        return getattr(self, key, default)
+
+# Field names of each model, computed once. ``from_api`` looks every field up
+# in the payload and passes it by name; absent keys become ``None``, the same
+# as each field's default.
+_STORY_FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(Story))
+_USER_FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(User))
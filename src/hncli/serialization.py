@@ -0,0 +1,32 @@
+"""
+JSON encoding helpers for the Hacker News CLI.
+
+``orjson`` is used when it is installed since it parses and serializes
+several times faster than the standard library; otherwise we fall back to
+the built-in ``json`` module. Both paths work with ``bytes``.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+
+    Raises ``ValueError`` (``json.JSONDecodeError``) for invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to JSON bytes, optionally indented for humans."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
@@ -0,0 +1,117 @@
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+_UNSET = object()
+
+
+@pytest.fixture(scope="session")
+def cli():
+    """The ``hncli.cli`` module, imported on first use rather than at collection."""
+    import hncli.cli
+
+    return hncli.cli
+
+
+@pytest.fixture(autouse=True)
+def fresh_config(cli):
+    """Drop memoized configuration so no test sees another test's settings."""
+    cli.config.load_config.cache_clear()
+    cli.config.load_settings.cache_clear()
+    cli.get_cache_ttl.cache_clear()
+    yield
+    cli.config.load_config.cache_clear()
+    cli.config.load_settings.cache_clear()
+    cli.get_cache_ttl.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def tmp_config(cli, monkeypatch, tmp_path):
+    """Point the configuration file at a temporary path and return it."""
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr(cli.config, "get_config_path", lambda: config_path)
+    return config_path
+
+
+@pytest.fixture
+def tmp_cache(cli, monkeypatch, tmp_path):
+    """Give the test an empty cache database in a temporary directory.
+
+    Yields the cache directory; the database is closed afterwards.
+    """
+    monkeypatch.setattr(cli.cache, "get_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(cli.cache, "_connection", None)
+    monkeypatch.setattr(cli.cache, "_cache", {})
+    monkeypatch.setattr(cli.cache, "_dead_ids", None)
+    yield tmp_path
+    cli.cache.close()
+
+
+class FakeResponse:
+    """Stand-in for the ``requests.Response`` objects the API helpers read."""
+
+    def __init__(self, content=b"", status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fake_response():
+    """Build fake API responses: ``fake_response(content, status_code=...)``."""
+    return FakeResponse
+
+
+@pytest.fixture
+def patch_cli(monkeypatch, cli):
+    """Patch the collaborators most CLI tests replace, in one call.
+
+    Returns the list of URLs passed to ``webbrowser.open``, which is always
+    patched so no test can launch a real browser. ``open_links`` sets the
+    ``open_links_in_browser`` setting. ``confirm`` may be a value to answer
+    every prompt with, or a replacement for the CLI's ``_confirm``.
+    """
+
+    def patch(open_links=_UNSET, confirm=_UNSET, story_ids=None, get_item=None, get_user=None):
+        opened = []
+        monkeypatch.setattr(cli.webbrowser, "open", lambda url: opened.append(url))
+        if open_links is not _UNSET:
+            settings = cli.config.ConfigBits(**cli.config.DEFAULT_CONFIG)._replace(open_links_in_browser=open_links)
+            monkeypatch.setattr(cli, "get_settings", lambda: settings)
+        if confirm is not _UNSET:
+            answer = confirm if callable(confirm) else lambda *a, **kw: confirm
+            monkeypatch.setattr(cli, "_confirm", answer)
+        if story_ids is not None:
+            monkeypatch.setattr(cli, "get_story_ids", lambda story_type: tuple(story_ids))
+        if get_item is not None:
+            monkeypatch.setattr(cli, "get_item", get_item)
+        if get_user is not None:
+            monkeypatch.setattr(cli, "get_user", get_user)
+        return opened
+
+    return patch
+
+
+@pytest.fixture
+def batch_patch(request):
+    """Patch many attributes of one object with a single patcher.
+
+    ``batch_patch(cli, name=value, ...)`` applies every replacement at once
+    and undoes them together when the test finishes.
+    """
+
+    def patch(target, **values):
+        patcher = mock.patch.multiple(target, **values)
+        patcher.start()
+        request.addfinalizer(patcher.stop)
+
+    return patch
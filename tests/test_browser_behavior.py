@@ -1,42 +1,62 @@
-from typer.testing import CliRunner
-import hncli.cli as cli
 from hncli.models import User
 
-runner = CliRunner()
 
-def test_open_auto(monkeypatch):
-    calls = []
-    monkeypatch.setattr(cli, "get_config_value", lambda key, default=None: True)
-    monkeypatch.setattr(cli.webbrowser, "open", lambda url: calls.append(url))
+def fake_user(username):
+    return User(id=username, created=0, karma=1, about="")
+
+
+def refuse_confirm(*args, **kwargs):
+    raise AssertionError("confirm called")
+
+
+def test_open_auto(cli, patch_cli, runner):
+    calls = patch_cli(open_links=True)
     result = runner.invoke(cli.app, ["open", "123"])
     assert result.exit_code == 0
-    assert calls == [f"{cli.HN_WEB_URL}/item?id=123"]
+    assert calls == [cli.HN_ITEM_URL + "123"]
 
-def test_open_prompt(monkeypatch):
-    calls = []
-    monkeypatch.setattr(cli, "get_config_value", lambda key, default=None: False)
-    monkeypatch.setattr(cli.webbrowser, "open", lambda url: calls.append(url))
-    monkeypatch.setattr(cli.typer, "confirm", lambda *a, **kw: True)
+
+def test_open_prompt(cli, patch_cli, runner):
+    calls = patch_cli(open_links=False, confirm=True)
     result = runner.invoke(cli.app, ["open", "456"])
     assert result.exit_code == 0
-    assert calls == [f"{cli.HN_WEB_URL}/item?id=456"]
-
-def test_user_auto(monkeypatch):
-    calls = []
-    monkeypatch.setattr(cli, "get_config_value", lambda key, default=None: True)
-    monkeypatch.setattr(cli, "get_user", lambda u: User(id=u, created=0, karma=1, about=""))
-    monkeypatch.setattr(cli.webbrowser, "open", lambda url: calls.append(url))
-    monkeypatch.setattr(cli.typer, "confirm", lambda *a, **kw: (_ for _ in ()).throw(AssertionError("confirm called")))
+    assert calls == [cli.HN_ITEM_URL + "456"]
+
+
+def test_user_auto(cli, patch_cli, runner):
+    calls = patch_cli(open_links=True, confirm=refuse_confirm, get_user=fake_user)
     result = runner.invoke(cli.app, ["user", "alice"])
     assert result.exit_code == 0
-    assert calls == [f"{cli.HN_WEB_URL}/user?id=alice"]
-
-def test_user_prompt(monkeypatch):
-    calls = []
-    monkeypatch.setattr(cli, "get_config_value", lambda key, default=None: False)
-    monkeypatch.setattr(cli, "get_user", lambda u: User(id=u, created=0, karma=1, about=""))
-    monkeypatch.setattr(cli.webbrowser, "open", lambda url: calls.append(url))
-    monkeypatch.setattr(cli.typer, "confirm", lambda *a, **kw: True)
+    assert calls == [cli.HN_USER_URL + "alice"]
+
+
+def test_user_prompt(cli, patch_cli, runner):
+    calls = patch_cli(open_links=False, confirm=True, get_user=fake_user)
     result = runner.invoke(cli.app, ["user", "bob"])
     assert result.exit_code == 0
-    assert calls == [f"{cli.HN_WEB_URL}/user?id=bob"]
+    assert calls == [cli.HN_USER_URL + "bob"]
+
+
+def test_story_view_prefetches_only_displayed_comments(cli, monkeypatch):
+    prefetched = []
+    story = cli.Story(id=1, kids=list(range(100, 130)))
+    monkeypatch.setattr(cli, "prefetch_items", lambda ids: prefetched.append(list(ids)))
+    monkeypatch.setattr(cli, "clear_screen", lambda: None)
+    monkeypatch.setattr(cli, "display_story", lambda story: None)
+    monkeypatch.setattr(cli, "display_comments", lambda story, max_comments: None)
+    monkeypatch.setattr(cli, "get_terminal_size", lambda: (80, 12))
+
+    cli.handle_story_viewing(story)
+    cli.handle_story_viewing(story, max_comments=0)
+    assert prefetched == [list(range(100, 107)), []]
+
+
+def test_get_items_ignores_expired_prefetches(cli, monkeypatch):
+    stale = cli.Future()
+    stale.set_result(cli.Story(id=5, title="stale"))
+    monkeypatch.setattr(cli, "_prefetched", {5: (0.0, stale)})
+    monkeypatch.setattr(cli.cache, "get_many", lambda keys, ttl: {})
+    monkeypatch.setattr(cli, "get_item", lambda item_id: cli.Story(id=item_id, title="fresh"))
+
+    assert cli.get_items([5])[0].get("title") == "fresh"
+    assert cli._prefetched == {}
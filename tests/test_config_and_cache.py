@@ -1,10 +1,7 @@
 import types
-from typer.testing import CliRunner
-import hncli.cli as cli
 
-runner = CliRunner()
 
-def test_config_set_boolean(monkeypatch):
+def test_config_set_boolean(cli, monkeypatch, runner):
     calls = []
     monkeypatch.setattr(cli.config, "update_setting", lambda k, v: calls.append((k, v)))
     result = runner.invoke(cli.app, ["config-set", "open_links_in_browser", "false"])
@@ -12,7 +9,7 @@ def test_config_set_boolean(monkeypatch):
     assert calls == [("open_links_in_browser", False)]
 
 
-def test_config_set_int(monkeypatch):
+def test_config_set_int(cli, monkeypatch, runner):
     calls = []
     monkeypatch.setattr(cli.config, "update_setting", lambda k, v: calls.append((k, v)))
     result = runner.invoke(cli.app, ["config-set", "stories_per_page", "15"])
@@ -20,20 +17,20 @@ def test_config_set_int(monkeypatch):
     assert calls == [("stories_per_page", 15)]
 
 
-def test_config_get_single_key(monkeypatch):
+def test_config_get_single_key(cli, monkeypatch, runner):
     monkeypatch.setattr(cli.config, "get_setting", lambda k: "value")
     result = runner.invoke(cli.app, ["config-get", "--key", "foo"])
     assert result.exit_code == 0
     assert "foo: value" in result.output
 
 
-def test_config_get_all(monkeypatch):
+def test_config_get_all(cli, monkeypatch, runner):
     called = []
     def load_config():
         called.append(True)
         return {"foo": "bar"}
     monkeypatch.setattr(cli.config, "load_config", load_config)
-    monkeypatch.setattr(cli, "calculate_stories_per_page", lambda: 10)
+    monkeypatch.setattr(cli, "calculate_stories_per_page", lambda size=None: 10)
     monkeypatch.setattr(cli, "shutil", types.SimpleNamespace(get_terminal_size=lambda: (80, 24)), raising=False)
     result = runner.invoke(cli.app, ["config-get"])
     assert result.exit_code == 0
@@ -41,7 +38,7 @@ def test_config_get_all(monkeypatch):
     assert "foo" in result.output
 
 
-def test_config_reset(monkeypatch):
+def test_config_reset(cli, monkeypatch, runner):
     calls = []
     monkeypatch.setattr(cli.config, "save_config", lambda val: calls.append(val))
     result = runner.invoke(cli.app, ["config-reset"])
@@ -49,10 +46,129 @@ def test_config_reset(monkeypatch):
     assert calls == [cli.config.DEFAULT_CONFIG]
 
 
-def test_cache_clear(monkeypatch):
+def test_cache_clear(cli, monkeypatch, runner):
     calls = []
     monkeypatch.setattr(cli.cache, "clear", lambda: calls.append(True))
     result = runner.invoke(cli.app, ["cache-clear"])
     assert result.exit_code == 0
     assert calls == [True]
     assert "Cache cleared" in result.output
+
+
+def test_config_round_trip(cli, tmp_config):
+    cli.config.save_config({"stories_per_page": 15, "color_theme": "dark"})
+    loaded = cli.config.load_config()
+    assert loaded["stories_per_page"] == 15
+    assert loaded["color_theme"] == "dark"
+    assert loaded["cache_timeout_minutes"] == cli.config.DEFAULT_CONFIG["cache_timeout_minutes"]
+
+    cli.config.update_setting("stories_per_page", 12)
+    assert cli.config.get_setting("stories_per_page") == 12
+
+
+def test_cache_persists_entries_in_database(cli, tmp_cache):
+    cli.cache.set(cli.cache.cache_key("item", 1), {"id": 1})
+    cli.cache.flush()
+    cli.cache._cache.clear()
+    assert cli.cache.get(cli.cache.cache_key("item", 1)) == {"id": 1}
+    assert cli.cache.get(cli.cache.cache_key("item", 2)) is None
+    assert (tmp_cache / "cache.db").exists()
+
+    cli.cache.clear()
+    cli.cache._cache.clear()
+    assert cli.cache.get(cli.cache.cache_key("item", 1)) is None
+
+
+def test_get_items_only_fetches_cache_misses(cli, monkeypatch, tmp_cache):
+    fetched = []
+
+    def fake_get_item(item_id):
+        fetched.append(item_id)
+        return cli.Story(id=item_id)
+
+    monkeypatch.setattr(cli, "get_item", fake_get_item)
+    cli.cache.set(cli.cache.cache_key("item", 2), {"id": 2, "title": "cached"})
+    items = cli.get_items([1, 2, 3])
+    assert [item.id for item in items] == [1, 2, 3]
+    assert items[1].get("title") == "cached"
+    assert sorted(fetched) == [1, 3]
+
+
+def test_get_item_skips_network_for_dead_items(cli, monkeypatch, tmp_cache, fake_response):
+    requests_made = []
+
+    def fake_get(url, **kwargs):
+        requests_made.append(url)
+        return fake_response(b'{"id": 7, "deleted": true}')
+
+    monkeypatch.setattr(cli.SESSION, "get", fake_get)
+    assert cli.get_item(7).get("deleted")
+    cli.cache.flush()
+    monkeypatch.setattr(cli.cache, "_dead_ids", None)
+    assert cli.get_item(7).get("deleted")
+    assert len(requests_made) == 1
+
+
+def test_get_item_does_not_remember_missing_or_dead_items(cli, monkeypatch, tmp_cache, fake_response):
+    payloads = {8: b"null", 9: b'{"id": 9, "type": "story", "dead": true}'}
+
+    def fake_get(url, **kwargs):
+        item_id = int(url.rsplit("/", 1)[1].split(".")[0])
+        return fake_response(payloads[item_id])
+
+    monkeypatch.setattr(cli.SESSION, "get", fake_get)
+    assert cli.get_item(8).get("deleted")
+    dead = cli.get_item(9)
+    assert dead.get("dead") and not dead.get("deleted")
+    cli.cache.flush()
+    assert not cli.cache.is_dead(8)
+    assert not cli.cache.is_dead(9)
+
+
+def test_expired_entry_is_revalidated_with_etag(cli, monkeypatch, tmp_cache, fake_response):
+    monkeypatch.setattr(cli, "get_cache_ttl", lambda: 60)
+    key = cli.cache.cache_key("stories", "top")
+    cli.cache.set(key, [1, 2, 3], etag="abc")
+    cli.cache._cache[key] = (0, [1, 2, 3], "abc")
+    sent_headers = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return fake_response(status_code=304)
+
+    monkeypatch.setattr(cli.SESSION, "get", fake_get)
+    assert cli.get_story_ids("top") == (1, 2, 3)
+    assert sent_headers[0]["If-None-Match"] == "abc"
+    # The 304 renewed the entry, so no second request is made
+    assert cli.get_story_ids("top") == (1, 2, 3)
+    assert len(sent_headers) == 1
+
+
+def test_config_reset_writes_defaults(cli, tmp_config, runner):
+    result = runner.invoke(cli.app, ["config-reset"])
+    assert result.exit_code == 0
+    assert cli.config.load_config() == dict(cli.config.DEFAULT_CONFIG)
+
+
+def test_load_settings_exposes_config_as_attributes(cli, tmp_config):
+    cli.config.save_config({"open_links_in_browser": False})
+    settings = cli.config.load_settings()
+    assert settings._fields == tuple(cli.config.DEFAULT_CONFIG)
+    assert settings.open_links_in_browser is False
+    assert settings.cache_timeout_minutes == cli.config.DEFAULT_CONFIG["cache_timeout_minutes"]
+
+
+def test_mark_dead_survives_concurrent_clear(cli, monkeypatch, tmp_cache):
+    original_load = cli.cache._load_dead_ids
+
+    def load_then_clear():
+        dead_ids = original_load()
+        # Simulate clear() running on the main thread mid-call
+        cli.cache._dead_ids = None
+        return dead_ids
+
+    monkeypatch.setattr(cli.cache, "_load_dead_ids", load_then_clear)
+    cli.cache.mark_dead(9)
+    # The in-memory set was dropped, so this reads back the queued write
+    cli.cache.flush()
+    assert cli.cache.is_dead(9)
@@ -1,23 +1,66 @@
-from typer.testing import CliRunner
 import pytest
-import hncli.cli as cli
 from hncli.errors import APIRequestError
 import requests
 
-runner = CliRunner()
 
-
-def test_get_story_ids_network_error(monkeypatch):
+def test_get_story_ids_network_error(cli, monkeypatch):
     def raise_error(*args, **kwargs):
         raise requests.RequestException("boom")
-    monkeypatch.setattr(cli.requests, "get", raise_error)
+    monkeypatch.setattr(cli.SESSION, "get", raise_error)
     with pytest.raises(APIRequestError):
         cli.get_story_ids("top")
 
 
-def test_cli_handles_api_error(monkeypatch):
+def test_cli_handles_api_error(cli, monkeypatch, runner):
     monkeypatch.setattr(cli, "get_story_ids", lambda t: (_ for _ in ()).throw(APIRequestError("fail")))
     result = runner.invoke(cli.app, ["top"])
     assert result.exit_code == 0
     assert "Error fetching top stories" in result.output
 
+
+
+def test_get_item_invalid_json(cli, monkeypatch, fake_response):
+    monkeypatch.setattr(cli.cache, "get_entry", lambda key: None)
+    monkeypatch.setattr(cli.cache, "is_dead", lambda item_id: False)
+    monkeypatch.setattr(cli.SESSION, "get", lambda *a, **kw: fake_response(b"<html>not json</html>"))
+    with pytest.raises(APIRequestError):
+        cli.get_item(1)
+
+
+def test_get_items_reports_failures_in_order(cli, monkeypatch):
+    def fake_get_item(item_id):
+        if item_id == 2:
+            raise APIRequestError("fail")
+        return cli.Story(id=item_id)
+
+    monkeypatch.setattr(cli, "get_item", fake_get_item)
+    monkeypatch.setattr(cli.cache, "get_many", lambda keys, ttl: {})
+    errors = []
+    items = cli.get_items([1, 2, 3], on_error=lambda i, e: errors.append(i))
+    assert [item.id if item else None for item in items] == [1, None, 3]
+    assert errors == [2]
+
+
+def test_get_items_skips_malformed_items(cli, monkeypatch):
+    def fake_get_item(item_id):
+        if item_id == 2:
+            raise TypeError("malformed payload")
+        return cli.Story(id=item_id)
+
+    monkeypatch.setattr(cli, "get_item", fake_get_item)
+    monkeypatch.setattr(cli.cache, "get_many", lambda keys, ttl: {})
+    errors = []
+    items = cli.get_items([1, 2, 3], on_error=lambda i, e: errors.append((i, type(e))))
+    assert [item.id if item else None for item in items] == [1, None, 3]
+    assert errors == [(2, TypeError)]
+
+
+def test_session_requests_compressed_responses(cli):
+    assert "gzip" in cli.SESSION.headers["Accept-Encoding"]
+
+
+def test_session_retries_transient_server_errors(cli):
+    retry = cli.SESSION.get_adapter(cli.BASE_URL).max_retries
+    assert retry.total == 3
+    assert 503 in retry.status_forcelist
+    assert "GET" in retry.allowed_methods
@@ -0,0 +1,56 @@
+import signal
+
+import pytest
+
+
+def test_format_time_ago_uses_given_now(cli):
+    now = 1_000_000
+    assert cli.format_time_ago(now - 30, now) == "30 seconds ago"
+    assert cli.format_time_ago(now - 5 * 60, now) == "5 minutes ago"
+    assert cli.format_time_ago(now - 3600, now) == "1 hours ago"
+    assert cli.format_time_ago(now - 3 * 3600, now) == "3 hours ago"
+    assert cli.format_time_ago(now - 2 * 86400, now) == "2 days ago"
+    assert cli.format_time_ago(now - 45 * 86400, now) == "1 months ago"
+    assert cli.format_time_ago(now - 400 * 86400, now) == "1 years ago"
+
+
+def test_html_to_text_strips_tags_and_unescapes(cli):
+    text = 'First<p>Second <a href="https://x.y">link</a> &lt;b&gt; it&#x27;s'
+    assert cli.html_to_text(text) == "First\n\nSecond link <b> it's"
+
+
+def test_format_time_ago_bucket_boundaries(cli):
+    now = 100_000_000
+    assert cli.format_time_ago(now - 59, now) == "59 seconds ago"
+    assert cli.format_time_ago(now - 60, now) == "1 minutes ago"
+    assert cli.format_time_ago(now - 359 * 86400, now) == "11 months ago"
+    assert cli.format_time_ago(now - 360 * 86400, now) == "1 years ago"
+
+
+def test_display_stories_links_self_posts_to_discussion(cli, capsys):
+    cli.display_stories([cli.Story(id=42, title="Ask HN: Anything?", time=0)])
+    output = capsys.readouterr().out
+    assert "Ask HN: Anything?" in output
+    assert "(news.ycombinator.com)" in output
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH is POSIX only")
+def test_resize_handler_is_installed_on_first_lookup_and_chained(cli, monkeypatch):
+    resizes = []
+    previous = signal.signal(signal.SIGWINCH, lambda signum, frame: resizes.append(signum))
+    try:
+        monkeypatch.setattr(cli, "_watching_resizes", None)
+        monkeypatch.setattr(cli, "_terminal_size", None)
+        monkeypatch.setattr(cli, "_previous_resize_handler", None)
+        monkeypatch.setattr(cli.shutil, "get_terminal_size", lambda: (100, 40))
+        assert signal.getsignal(signal.SIGWINCH) is not cli._forget_terminal_size
+
+        assert cli.get_terminal_size() == (100, 40)
+        assert signal.getsignal(signal.SIGWINCH) is cli._forget_terminal_size
+        assert cli._terminal_size == (100, 40)
+
+        signal.raise_signal(signal.SIGWINCH)
+        assert cli._terminal_size is None
+        assert resizes == [signal.SIGWINCH]
+    finally:
+        signal.signal(signal.SIGWINCH, previous)
@@ -0,0 +1,19 @@
+from hncli.models import Story, User
+
+
+def test_from_api_ignores_unknown_fields():
+    story = Story.from_api({"id": 1, "title": "Hello", "kids": [2], "unexpected": True})
+    assert story.get("title") == "Hello"
+    assert story.get("kids") == [2]
+    assert story.get("unexpected", "missing") == "missing"
+
+    user = User.from_api({"id": "pg", "karma": 10, "delay": 0})
+    assert user.get("karma") == 10
+
+
+def test_get_falls_back_to_default_for_missing_fields():
+    story = Story.from_api({"id": 1})
+    assert story.get("kids", []) == []
+    assert story.get("title", "No title") == "No title"
+    assert story.get("score", 0) == 0
+    assert Story(id=2, score=0).get("score", 5) == 0
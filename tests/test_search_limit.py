@@ -1,9 +1,18 @@
-from typer.testing import CliRunner
-import hncli.cli as cli
+import time
 
-runner = CliRunner()
 
-def test_search_limit(monkeypatch):
+def patch_browsing(cli, batch_patch, captured):
+    """Quit the interactive browser at once, recording the first page shown."""
+    batch_patch(
+        cli,
+        show_navigation_menu=lambda *a, **kw: "q",
+        clear_screen=lambda: None,
+        calculate_stories_per_page=lambda size=None: 10,
+        display_stories=lambda items, size=None: captured.append(list(items)),
+    )
+
+
+def test_search_limit(cli, patch_cli, batch_patch, runner):
     # Prepare fake stories
     stories = [
         {
@@ -19,20 +28,84 @@ def test_search_limit(monkeypatch):
         for i in range(10)
     ]
 
-    monkeypatch.setattr(cli, "get_story_ids", lambda t: list(range(10)))
-    monkeypatch.setattr(cli, "get_item", lambda i: stories[i])
-    monkeypatch.setattr(cli, "show_navigation_menu", lambda *a, **kw: "q")
-    monkeypatch.setattr(cli, "clear_screen", lambda: None)
-    monkeypatch.setattr(cli, "calculate_stories_per_page", lambda: 10)
-
+    patch_cli(story_ids=range(10), get_item=lambda i: stories[i])
     captured = []
-
-    def fake_display(items):
-        captured.append(list(items))
-
-    monkeypatch.setattr(cli, "display_stories", fake_display)
+    patch_browsing(cli, batch_patch, captured)
 
     result = runner.invoke(cli.app, ["search", "story", "--limit", "5"])
     assert result.exit_code == 0
     assert captured
     assert len(captured[0]) <= 5
+
+
+def test_compile_query_requires_every_term(cli):
+    matches = cli.compile_query("Rust  Compiler")
+    assert matches("a new compiler\nwritten in rust")
+    assert not matches("rust only")
+    assert cli.compile_query("rust")("trust me")
+    assert cli.compile_query("")("anything")
+
+
+def test_search_stops_fetching_after_limit(cli, patch_cli, batch_patch, runner):
+    fetched = []
+
+    def fake_get_item(i):
+        fetched.append(i)
+        return {"id": i, "type": "story", "title": f"Story {i}", "text": "", "kids": [], "time": 0}
+
+    patch_cli(story_ids=range(300), get_item=fake_get_item)
+    captured = []
+    patch_browsing(cli, batch_patch, captured)
+
+    result = runner.invoke(cli.app, ["search", "story", "--limit", "5"])
+    assert result.exit_code == 0
+    assert [story["id"] for story in captured[0]] == [0, 1, 2, 3, 4]
+    assert len(fetched) < 300
+
+
+def test_search_keeps_best_ranked_match_that_finishes_last(cli, patch_cli, batch_patch, runner):
+    def fake_get_item(i):
+        if i == 0:
+            # The top-ranked story is the slowest to arrive
+            time.sleep(0.2)
+        return {"id": i, "type": "story", "title": f"Story {i}", "text": "", "kids": [], "time": 0}
+
+    patch_cli(story_ids=range(50), get_item=fake_get_item)
+    captured = []
+    patch_browsing(cli, batch_patch, captured)
+
+    result = runner.invoke(cli.app, ["search", "story", "--limit", "2"])
+    assert result.exit_code == 0
+    assert [story["id"] for story in captured[0]] == [0, 1]
+
+
+def test_search_negative_limit_keeps_best_match(cli, patch_cli, batch_patch, runner):
+    patch_cli(
+        story_ids=range(10),
+        get_item=lambda i: {"id": i, "type": "story", "title": f"Story {i}", "text": "", "kids": [], "time": 0},
+    )
+    captured = []
+    patch_browsing(cli, batch_patch, captured)
+
+    result = runner.invoke(cli.app, ["search", "story", "--limit", "-1"])
+    assert result.exit_code == 0
+    assert [story["id"] for story in captured[0]] == [0]
+
+
+def test_search_zero_limit_returns_every_match(cli, patch_cli, batch_patch, runner):
+    patch_cli(
+        story_ids=range(10),
+        get_item=lambda i: {"id": i, "type": "story", "title": f"Story {i}", "text": "", "kids": [], "time": 0},
+    )
+    captured = []
+    batch_patch(
+        cli,
+        show_navigation_menu=lambda *a, **kw: "q",
+        clear_screen=lambda: None,
+        calculate_stories_per_page=lambda size=None: 20,
+        display_stories=lambda items, size=None: captured.append(list(items)),
+    )
+
+    result = runner.invoke(cli.app, ["search", "story", "--limit", "0"])
+    assert result.exit_code == 0
+    assert [story["id"] for story in captured[0]] == list(range(10))